@@ -9,26 +9,36 @@ The UI asks multiple-choice questions (4 options). It supports a few
 question styles to practice conjugations, tenses, moods, and pronouns.
 """
 
+import collections
+import functools
 import os
 import platform
+import re
 import sys
 import random
+import time
 import tkinter as tk
+from tkinter import font as tkfont
 from tkinter import messagebox, ttk
-from arabic_reshaper import ArabicReshaper
-from bidi.algorithm import get_display
 import arabic_conjugator_hmolavi as ac
 
+# The OS can't change mid-run; look it up once
+_SYSTEM = platform.system()
+
 
 def is_system_macos():
     """Check if the current operating system is macOS."""
-    return platform.system() == "Darwin"
+    return _SYSTEM == "Darwin"
 
 
 def should_reverse_gui_text():
     """
     Determines if Arabic text needs to be reshaped and reversed for GUI display.
 
+    The result is read once at import into _REVERSE, which is what format_text_gui
+    checks. Assigning FORCE_REVERSE_GUI directly after import therefore has no effect;
+    set_force_reverse() is the only supported way to override it at runtime.
+
     Returns:
         bool: True if the OS is likely a minimal environment (like Linux on Replit)
               that requires a fix. False otherwise.
@@ -36,21 +46,99 @@ def should_reverse_gui_text():
     # CLI/GUI override takes precedence when set
     if "FORCE_REVERSE_GUI" in globals() and globals().get("FORCE_REVERSE_GUI") is not None:
         return bool(globals().get("FORCE_REVERSE_GUI"))
-    return platform.system() == "Linux"
+    return _SYSTEM == "Linux"
+
+
+# Resolved once at import: the platform doesn't change mid-run. Use set_force_reverse()
+# to override it afterwards (setting FORCE_REVERSE_GUI by hand is no longer picked up).
+_REVERSE = should_reverse_gui_text()
+
+
+def set_force_reverse(value):
+    """Set the FORCE_REVERSE_GUI override (None restores platform detection) and re-resolve _REVERSE.
+
+    This is the only supported override: format_text_gui reads _REVERSE, not the global.
+    Call it before building QuizApp, since already-rendered text isn't reformatted. If
+    reversing is switched on here rather than at import, options are shaped on demand
+    (through the _do_format cache) instead of coming from the pre-shaped table.
+    """
+    global FORCE_REVERSE_GUI, _REVERSE
+    FORCE_REVERSE_GUI = value
+    _REVERSE = should_reverse_gui_text()
+
+
+# macOS marks answers with ✅/❌ next to the button colours; resolved once like _REVERSE
+_ANSWER_MARKS = is_system_macos()
+
+# Built lazily by _get_formatter(); platforms that don't reverse never import them.
+_RESHAPER = None
+_GET_DISPLAY = None
+
+
+def _get_formatter():
+    """Import arabic_reshaper/bidi on first use and return (reshaper, get_display).
+
+    Building an ArabicReshaper parses its config and ligature tables, so a single
+    instance is shared.
+    """
+    global _RESHAPER, _GET_DISPLAY
+    if _RESHAPER is None:
+        from arabic_reshaper import ArabicReshaper
+        from bidi.algorithm import get_display
+
+        _RESHAPER = ArabicReshaper(configuration={"delete_harakat": False, "shift_harakat_position": False})
+        _GET_DISPLAY = get_display
+    return _RESHAPER, _GET_DISPLAY
+
+
+@functools.lru_cache(maxsize=8192)
+def _do_format(text):
+    """Reshape + bidi a single string (memoized; the same forms recur across questions)."""
+    try:
+        reshaper, get_display = _get_formatter()
+        return get_display(reshaper.reshape(text))
+    except Exception:
+        return text
+
+
+# Arabic, Arabic Supplement and the presentation-form blocks; strings without any of
+# these are left alone by format_text_gui
+_ARABIC_RE = re.compile("[\u0600-\u06FF\u0750-\u077F\uFB50-\uFDFF\uFE70-\uFEFF]")
+
+# raw option string (conjugated form, pronoun label or verb) -> display string, filled in
+# batches by _build_conjugation_table()
+_FORMS_DISPLAY = {}
+
+
+def _format_batch(texts):
+    """Reshape + bidi several strings in one pass and return {text: display}.
+
+    bidi treats every line as its own paragraph, so joining on newlines keeps the
+    strings in order; if the split doesn't line up, format them one by one.
+    """
+    texts = [t for t in texts if t]
+    try:
+        reshaper, get_display = _get_formatter()
+        shown = get_display(reshaper.reshape("\n".join(texts))).split("\n")
+    except Exception:
+        shown = []
+    if len(shown) != len(texts):
+        shown = [_do_format(t) for t in texts]
+    return dict(zip(texts, shown))
 
 
 def format_text_gui(text):
     """Return a GUI-ready string: reshape + bidi if GUI environment requires it and reshaper is available."""
-    if not text:
+    if not text or not _REVERSE:
         return text
-    if not should_reverse_gui_text():
+    text = str(text)
+    # Nothing to reshape in pure English labels (e.g. "Past", "Select the correct ...")
+    if text.isascii() or not _ARABIC_RE.search(text):
         return text
-    try:
-        cfg = {"delete_harakat": False, "shift_harakat_position": False}
-        return get_display(ArabicReshaper(configuration=cfg).reshape(str(text)))
-    except Exception:
-        pass
-    return text
+    shown = _FORMS_DISPLAY.get(text)
+    if shown is not None:
+        return shown
+    return _do_format(text)
 
 
 # Example verbs with their associated "bab" (remove random bab selection - each verb carries its bab)
@@ -65,6 +153,9 @@ SAMPLE_VERBS = [
     {"verb": "قَرَأَ", "bab": "Fatha/Fatha (فَتَحَ / يَفْتَحُ)"},
     {"verb": "دَخَلَ", "bab": "Fatha/Damma (نَصَرَ / يَنْصُرُ)"},
 ]
+# Parallel views of SAMPLE_VERBS so question generation picks by index
+_VERB_NAMES = tuple(e["verb"] for e in SAMPLE_VERBS)
+_VERB_BABS = tuple(e.get("bab") for e in SAMPLE_VERBS)
 
 # Pronoun labels matching the 14-form ordering used by the conjugator
 PRONOUNS = [
@@ -84,31 +175,172 @@ PRONOUNS = [
     ("1st pl", "نحن"),
 ]
 
+# Option labels used by make_style4, e.g. "هو - (3rd masc sing)"
+PRONOUN_LABELS = tuple(f"{ar} - ({en})" for en, ar in PRONOUNS)
+
 UNIQUE_PRONOUNS_IDX = [0, 1, 2, 3, 5, 6, 7, 8, 9, 11, 12, 13]  # excludes duplicates: 7=10, 1=4
+# Second-person pronouns of UNIQUE_PRONOUNS_IDX: the only ones with an imperative form
+_IMPERATIVE_PRONS = tuple(i for i in UNIQUE_PRONOUNS_IDX if 6 <= i <= 11)
+# Every form slot (duplicates included) that has an imperative conjugation
+_IMPERATIVE_SLOTS = frozenset(range(6, 12))
+# Duplicate pronoun slots mapped to the UNIQUE_PRONOUNS_IDX entry with the same form
+_PRON_CANON = {4: 1, 10: 7}
+
+# Dedicated RNG for question generation and option shuffling (see seed())
+_RNG = random.Random()
+
+
+def seed(n):
+    """Seed the quiz RNG (e.g. for deterministic tests).
+
+    Call it before constructing QuizApp: questions already prefetched into its queue
+    were drawn with the old state.
+    """
+    _RNG.seed(n)
+
+
+# Constant pools drawn from on every question (built once instead of per call)
+_TENSES = ("past", "present")
+# make_style1 orders these for the question and its two cross-tense distractors
+_STYLE1_TENSES = ("present", "present", "past")
+_MOOD_NAMES = tuple(sys.intern(m[0]) for m in ac.MOODS)
+# The mood that only has second-person forms. Interned like _MOOD_NAMES, so == against a mood
+# picked from there short-circuits on identity (moods from elsewhere still compare by value)
+_IMPERATIVE = sys.intern("Imperative (أمر)")
+# Every (tense, mood) the quiz conjugates: past has no mood, present has each mood
+_TENSE_MOOD_PAIRS = (("past", None),) + tuple(("present", m) for m in _MOOD_NAMES)
+# make_style2 option labels, e.g. "Past" or "Present - Jussive (مجزوم)"
+_TENSE_MOOD_LABELS = {(t, m): t.capitalize() if m is None else f"{t.capitalize()} - {m}" for t, m in _TENSE_MOOD_PAIRS}
+# Tense/mood as shown in question and meta text, e.g. "Past" or "Present Jussive (مجزوم)"
+_TENSE_MOOD_TITLES = {(t, m): t.capitalize() if m is None else f"{t.capitalize()} {m}" for t, m in _TENSE_MOOD_PAIRS}
+# For each (tense, mood), every other pair: the distractor combos of styles 2 and 3
+_OTHER_TENSE_MOODS = {pair: tuple(p for p in _TENSE_MOOD_PAIRS if p != pair) for pair in _TENSE_MOOD_PAIRS}
+# make_style3's pronoun pools, keyed (imperative target?, canonical source pronoun):
+# the target's pronouns minus the source one
+_STYLE3_PRON_POOLS = {
+    (imp, can): tuple(p for p in (_IMPERATIVE_PRONS if imp else UNIQUE_PRONOUNS_IDX) if p != can)
+    for imp in (False, True)
+    for can in range(14)
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_conjugate(verb, tense, bab_key, mood, reverse_input):
+    """Memoized call into the package's conjugate_verb.
+
+    Forms are returned as a tuple so the cached value can't be mutated by callers.
+    Exceptions propagate and are never cached.
+    """
+    title, forms = ac.conjugate_verb(verb, tense=tense, bab_key=bab_key, mood=mood, reverse_input=reverse_input)
+    return title, tuple(forms)
+
+
+# (verb, tense, bab_key, mood) -> (title, forms) for every combination the quiz can ask
+# about; filled once at import by _build_conjugation_table() below.
+ALL_FORMS = {}
+
+
+@functools.lru_cache(maxsize=64)
+def _fallback_forms(verb):
+    """Placeholder forms ("verb[0]" .. "verb[13]") used when the conjugator is unavailable."""
+    return tuple(f"{verb}[{i}]" for i in range(14))
 
 
 def safe_conjugate(verb, tense="past", bab_key=None, mood=None, reverse_input=False):
     """Wrapper that calls the package's conjugate_verb and returns (title, forms).
 
+    Lookups for SAMPLE_VERBS are served from the precomputed ALL_FORMS table. Anything
+    else is cached per (verb, tense, bab_key, mood, reverse_input), so styles that
+    re-conjugate the same verb for distractors don't pay for the conjugator twice.
     If the package is not importable, return placeholder forms for testing.
     """
+    if not reverse_input:
+        hit = ALL_FORMS.get((verb, tense, bab_key, mood))
+        if hit is not None:
+            return hit
     if ac:
         try:
-            return ac.conjugate_verb(verb, tense=tense, bab_key=bab_key, mood=mood, reverse_input=reverse_input)
+            return _cached_conjugate(verb, tense, bab_key, mood, reverse_input)
         except Exception as e:
             # fall through to fallback
             print("Conjugation error:", e)
 
     # Fallback: manufacture fake conjugations by appending index (for offline testing)
-    forms = [f"{verb}[{i}]" for i in range(14)]
     title = f"{tense} - {mood or 'default'}"
-    return title, forms
+    return title, _fallback_forms(verb)
+
+
+def _unique_options(correct, candidates, k=3, max_tries=12):
+    """Return [correct] followed by up to k distinct distractors.
+
+    candidates is consumed lazily (typically a generator), so alternates are only
+    computed when an earlier distractor collided with one already chosen. Empty
+    forms (e.g. imperative slots with no conjugation) are skipped. Gives up after
+    max_tries candidates.
+    """
+    options = [correct]
+    for tries, cand in enumerate(candidates):
+        if tries >= max_tries:
+            break
+        if cand and cand not in options:
+            options.append(cand)
+            if len(options) > k:
+                break
+    return options
+
+
+def _combo_form(verb, bab, tense, mood, pron, candidates=None, fallback_forms=None):
+    """Pick one form of verb in (tense, mood) for make_style3's distractors.
+
+    Uses the first of candidates (a pronoun pool) that has a form in that mood, else pron
+    itself, else a default imperative slot.
+    """
+    _, fr = safe_conjugate(verb, tense=tense, bab_key=bab if tense == "present" else None, mood=mood)
+    is_imp = mood == _IMPERATIVE
+    # choose pronoun from candidates if provided and valid for imperative
+    if candidates:
+        if is_imp:
+            cand = next((p for p in candidates if p in _IMPERATIVE_SLOTS), None)
+        else:
+            cand = candidates[0]
+        if cand is not None:
+            return fr[cand]
+    # otherwise fall back to using the same pron if valid, else 0
+    if is_imp and pron not in _IMPERATIVE_SLOTS:
+        # pick a default imperative pronoun
+        return fr[6]
+    return fr[pron] if pron < len(fr) else (fallback_forms or fr)[0]
+
+
+def _build_conjugation_table():
+    """Conjugate each sample verb in the past and in every present mood (with its own bab).
+
+    The universe is tiny (9 verbs x 5 combos), so doing it up front turns question
+    generation into pure table lookups. When the GUI needs reshaping, the 14 forms
+    are also formatted (in one batch per combo) so rendering an option is a lookup; so
+    are the pronoun labels and verbs that styles 4 and 5 offer as options.
+    """
+    for verb, bab in zip(_VERB_NAMES, _VERB_BABS):
+        combos = [("past", None, None)] + [("present", bab, m) for m in _MOOD_NAMES]
+        for tense, bab_key, mood in combos:
+            title, forms = safe_conjugate(verb, tense=tense, bab_key=bab_key, mood=mood)
+            ALL_FORMS[(verb, tense, bab_key, mood)] = (title, forms)
+            if _REVERSE:
+                _FORMS_DISPLAY.update(_format_batch(forms))
+    if _REVERSE:
+        # style4 and style5 show pronoun labels and bare verbs as options
+        _FORMS_DISPLAY.update(_format_batch(PRONOUN_LABELS + _VERB_NAMES))
+
+
+_build_conjugation_table()
 
 
 class QuizApp:
     def __init__(self, master):
         self.master = master
         master.title("Arabic Conjugation Quiz")
+        # The window background never changes; read it once instead of querying Tk per button
+        self._master_bg = master.cget("bg")
 
         self.score = 0
         self.total = 0
@@ -116,34 +348,60 @@ class QuizApp:
         self.scoring_enabled = False
 
         # UI layout
-        self.header = tk.Label(master, text="Arabic Conjugation Quiz", font=(None, 16))
+        # Named fonts shared by the resizable widgets; apply_font_size() only reconfigures these
+        self._header_font = tkfont.Font(master, size=16)
+        self._main_font = tkfont.Font(master, size=14)
+        self._meta_font = tkfont.Font(master, size=12)
+        # Size last applied by apply_font_size(); reselecting it is a no-op
+        self._font_size = None
+        # Pending debounced apply_font_size() call from on_font_size_change(), if any
+        self._font_apply_id = None
+
+        self.header = tk.Label(master, text="Arabic Conjugation Quiz", font=self._header_font)
         self.header.pack(pady=6)
 
         self.question_frame = tk.Frame(master)
         self.question_frame.pack(pady=10)
 
-        self.q_text = tk.Label(self.question_frame, text="", font=(None, 14), wraplength=1500, justify="center")
-        self.q_text.pack()
+        self.q_text = tk.Label(self.question_frame, text="", font=self._main_font, wraplength=1500, justify="center")
+        self.q_text.grid(row=0, column=0)
 
         # Meta/hint: create the meta label but don't show it by default. A hint button will occupy
         # the same location; clicking it will reveal the meta and hide the button for that question.
-        self.meta_text = tk.Label(self.question_frame, text="", fg="gray")
+        # Both share one grid cell; grid_remove() hides a widget but keeps its cell options, so
+        # swapping them doesn't make Tk re-lay-out its siblings.
+        self.meta_text = tk.Label(self.question_frame, text="", fg="gray", font=self._meta_font)
+        self.meta_text.grid(row=1, column=0)
+        self.meta_text.grid_remove()
         # hint button placed where meta would appear
         self.hint_button = tk.Button(self.question_frame, text="Show hint", command=self.show_hint)
-        self.hint_button.pack()
+        self.hint_button.grid(row=1, column=0)
+        # True while the meta is showing in place of the hint button
+        self._hint_shown = False
 
         self.buttons_frame = tk.Frame(master)
         self.buttons_frame.pack(pady=8)
 
         self.option_vars = []
         self.option_buttons = []
+        # Whether option clicks are accepted; cleared once feedback is shown and in review
+        self._interactive = False
+        # Set whenever answer/review colours are applied, so reset_btn_colors() can skip otherwise
+        self._buttons_colored = False
         for i in range(4):
-            btn = tk.Button(self.buttons_frame, text=f"Option {i+1}", width=25, height=2, command=lambda i=i: self.check_answer(i))
+            btn = tk.Button(
+                self.buttons_frame,
+                text=f"Option {i+1}",
+                width=25,
+                height=2,
+                font=self._main_font,
+                command=lambda i=i: self.check_answer(i),
+            )
             btn.grid(row=i // 2, column=i % 2, padx=6, pady=4)
             self.option_buttons.append(btn)
 
         # Start with scoring shown as disabled (greyed out)
-        self.status = tk.Label(master, text="Score: 0 / 0", fg=self.master.cget("bg"))
+        self.status = tk.Label(master, text="Score: 0 / 0", fg=self._master_bg, font=self._meta_font)
         self.status.pack(pady=6)
 
         self.controls = tk.Frame(master)
@@ -177,8 +435,15 @@ class QuizApp:
 
         # question generation state
         self.correct_index = None
-        self.current_answer = None
         self.current_style = None
+        self.current_question_dict = None
+        self.shown_options = []
+        # Question builders indexed by style number - 1
+        self._style_builders = (self.make_style1, self.make_style2, self.make_style3, self.make_style4, self.make_style5)
+        # Questions built ahead of time during Tk idle time: (style, question dict) pairs
+        self.PREFETCH_DEPTH = 4
+        self._question_queue = collections.deque()
+        self._prefetch_id = None  # after_idle() id while a refill is pending
 
         self.next_question()
 
@@ -188,11 +453,13 @@ class QuizApp:
         self.TEST_LENGTH = 15  # Global fixed number of questions in a test
         self.test_index = 0  # 0-based index of current test question
         self.test_records = []  # List of dict per question: {q, chosen_idx, correct_idx, skipped, options}
+        self.review_pointer = 0  # index into test_records while reviewing
         self.test_start_time = None
         self.stopwatch_id = None  # after() id for timer updates
-        self.stopwatch_label = tk.Label(self.master, text="", font=(None, 10))
-        self.stopwatch_label.place(relx=1.0, rely=1.0, anchor="se", x=-6, y=-6)  # bottom-right corner
-        self.final_score_label = tk.Label(self.master, text="", font=(None, 12))
+        # Test-only labels are created on first use; most sessions never start a test
+        self.stopwatch_label = None
+        self._stopwatch_text = ""  # text last shown on stopwatch_label
+        self.final_score_label = None
 
     # ---------------- Test Mode Functions -----------------
     def start_test(self):
@@ -205,7 +472,8 @@ class QuizApp:
         self.test_records = []
         self.score = 0
         self.total = 0
-        self.final_score_label.config(text="")
+        if self.final_score_label is not None:
+            self.final_score_label.config(text="")
         # disable scoring (test handles correctness separately)
         self.scoring_enabled = False
         self.update_status()
@@ -231,7 +499,8 @@ class QuizApp:
         self.review_mode = False
         self.test_index = 0
         self.test_records = []
-        self.final_score_label.config(text="")
+        if self.final_score_label is not None:
+            self.final_score_label.config(text="")
         # re-enable test button
         try:
             self.test_button.config(text="Test", state=tk.NORMAL, command=self.start_test)
@@ -252,9 +521,8 @@ class QuizApp:
         self.next_question()
 
     def _now_seconds(self):
-        import time
-
-        return time.time()
+        # monotonic: immune to wall-clock adjustments during a test
+        return time.monotonic()
 
     def _elapsed_seconds(self):
         if self.test_start_time is None:
@@ -266,14 +534,25 @@ class QuizApp:
         s = secs % 60
         return f"{m:02d}:{s:02d}"
 
+    def _set_stopwatch_text(self, text):
+        """Update the stopwatch label, skipping the Tk call when the text is unchanged."""
+        if text == self._stopwatch_text:
+            return
+        if self.stopwatch_label is None:
+            self.stopwatch_label = tk.Label(self.master, text="", font=(None, 10))
+            self.stopwatch_label.place(relx=1.0, rely=1.0, anchor="se", x=-6, y=-6)  # bottom-right corner
+        try:
+            self.stopwatch_label.config(text=text)
+        except Exception:
+            return
+        self._stopwatch_text = text
+
     def _update_stopwatch(self):
         if self.test_mode:
-            elapsed = self._format_elapsed(self._elapsed_seconds())
-            try:
-                self.stopwatch_label.config(text=elapsed)
-            except Exception:
-                pass
-            self.stopwatch_id = self.master.after(1000, self._update_stopwatch)
+            self._set_stopwatch_text(self._format_elapsed(self._elapsed_seconds()))
+            # wake up on the next whole second since the start so the display doesn't drift
+            elapsed_ms = int((self._now_seconds() - self.test_start_time) * 1000)
+            self.stopwatch_id = self.master.after(1000 - elapsed_ms % 1000, self._update_stopwatch)
         else:
             # stop updates; keep text during review, clear otherwise
             if self.stopwatch_id:
@@ -283,10 +562,7 @@ class QuizApp:
                     pass
                 self.stopwatch_id = None
             if not self.review_mode:
-                try:
-                    self.stopwatch_label.config(text="")
-                except Exception:
-                    pass
+                self._set_stopwatch_text("")
 
     def on_next_pressed(self):
         """Handler for Next button: skip or advance depending on mode."""
@@ -303,11 +579,13 @@ class QuizApp:
     def _record_test_answer(self, chosen_idx=None, skipped=False):
         """Store current question details."""
         rec = {
-            "q": getattr(self, "current_question_dict", None),
+            "q": self.current_question_dict,
             "chosen_idx": chosen_idx,
             "correct_idx": self.correct_index,
             "skipped": skipped,
-            "options": list(getattr(self, "shown_options", [])),
+            # display_question builds a fresh list per question and never mutates it, so the
+            # record can share it instead of copying
+            "options": self.shown_options,
         }
         self.test_records.append(rec)
         if not skipped and chosen_idx is not None and chosen_idx == self.correct_index:
@@ -326,10 +604,7 @@ class QuizApp:
         # stop timing and freeze stopwatch in review
         self.test_mode = False
         self.review_mode = True
-        try:
-            self.stopwatch_label.config(text=self._format_elapsed(self._elapsed_seconds()))
-        except Exception:
-            pass
+        self._set_stopwatch_text(self._format_elapsed(self._elapsed_seconds()))
         self._update_stopwatch()
         # enable test button as Exit
         try:
@@ -341,6 +616,8 @@ class QuizApp:
         # display first record with feedback
         self._show_review_question(0)
         # show final score label
+        if self.final_score_label is None:
+            self.final_score_label = tk.Label(self.master, text="", font=(None, 12))
         try:
             self.final_score_label.config(text=f"Score: {self.score} / {self.TEST_LENGTH}")
             self.final_score_label.pack(after=self.status, pady=2)
@@ -369,7 +646,7 @@ class QuizApp:
     def _update_review_nav_buttons(self):
         if not self.review_mode:
             return
-        idx = getattr(self, "review_pointer", 0)
+        idx = self.review_pointer
         try:
             self.left_btn.config(state=(tk.NORMAL if idx > 0 else tk.DISABLED))
         except Exception:
@@ -382,13 +659,13 @@ class QuizApp:
     def _review_prev(self):
         if not self.review_mode:
             return
-        self.review_pointer = max(0, getattr(self, "review_pointer", 0) - 1)
+        self.review_pointer = max(0, self.review_pointer - 1)
         self._show_review_question(self.review_pointer)
 
     def _review_next(self):
         if not self.review_mode:
             return
-        self.review_pointer = min(len(self.test_records) - 1, getattr(self, "review_pointer", 0) + 1)
+        self.review_pointer = min(len(self.test_records) - 1, self.review_pointer + 1)
         self._show_review_question(self.review_pointer)
 
     def _show_review_question(self, idx):
@@ -406,66 +683,45 @@ class QuizApp:
         if chosen is not None and not rec.get("skipped"):
             self._apply_feedback_visuals(chosen, self.correct_index)
         else:
-            # show correct answer only, but ensure all buttons show stored option text
-            if self.correct_index is not None:
-                for i, btn in enumerate(self.option_buttons):
-                    opt_text = self.shown_options[i]
-                    if i == self.correct_index:
-                        display = opt_text + (" ✅" if is_system_macos() else "")
-                        try:
-                            btn.config(text=display, bg="#90EE90", activebackground="#90EE90")
-                        except Exception:
-                            pass
-                    else:
-                        try:
-                            btn.config(text=opt_text, bg=self.master.cget("bg"))
-                        except Exception:
-                            pass
+            # show correct answer only, but ensure all buttons show stored option text.
+            # Each button gets a single config call; short or empty records leave the rest blank.
+            for i, btn in enumerate(self.option_buttons):
+                opt_text = self.shown_options[i] if i < len(self.shown_options) else ""
+                if i == self.correct_index:
+                    display = opt_text + (" ✅" if _ANSWER_MARKS else "")
+                    kwargs = {"text": display, "bg": "#90EE90", "activebackground": "#90EE90"}
+                else:
+                    kwargs = {"text": opt_text, "bg": self._master_bg}
+                btn.config(**kwargs)
+            self._buttons_colored = True
         # disable interactive clicking in review
-        for btn in self.option_buttons:
-            try:
-                btn.config(command=lambda: None)
-            except Exception:
-                pass
+        self._interactive = False
         self._update_review_nav_buttons()
         self.update_status()
 
     def _apply_feedback_visuals(self, chosen_idx, correct_idx):
         for i, btn in enumerate(self.option_buttons):
-            opt_text = self.shown_options[i]
-            display = opt_text
-            bg_color = self.master.cget("bg")
-
-            def append_symbol(text, correct_ans):
-                if not is_system_macos():
-                    return text
-                return f"{text} {'✅' if correct_ans else '❌'}"
-
-            if i == chosen_idx:
-                if i == correct_idx:
-                    display = append_symbol(opt_text, True)
-                    bg_color = "#90EE90"
-                else:
-                    display = append_symbol(opt_text, False)
-                    bg_color = "#FFB6C6"
-            elif i == correct_idx:
-                display = append_symbol(opt_text, True)
+            opt_text = self.shown_options[i] if i < len(self.shown_options) else ""
+            if i == correct_idx:
+                display = opt_text + (" ✅" if _ANSWER_MARKS else "")
                 bg_color = "#90EE90"
-            try:
-                btn.config(text=display, bg=bg_color, activebackground=bg_color)
-            except Exception:
-                pass
-            try:
-                btn.config(command=lambda: None)
-            except Exception:
-                pass
+            elif i == chosen_idx:
+                display = opt_text + (" ❌" if _ANSWER_MARKS else "")
+                bg_color = "#FFB6C6"
+            else:
+                display = opt_text
+                bg_color = self._master_bg
+            btn.config(text=display, bg=bg_color, activebackground=bg_color)
+        self._buttons_colored = True
+        # the question is answered: ignore further clicks until the next one is shown
+        self._interactive = False
 
     def update_status(self):
         # In test mode / review mode show question counter instead of score until finished.
         if self.test_mode:
             self.status.config(text=f"Question {self.test_index + 1} / {self.TEST_LENGTH}")
         elif self.review_mode:
-            idx = getattr(self, "review_pointer", 0)
+            idx = self.review_pointer
             base = f"Question {idx + 1} / {self.TEST_LENGTH}"
             try:
                 rec = self.test_records[idx]
@@ -476,39 +732,38 @@ class QuizApp:
             self.status.config(text=base)
         else:
             self.status.config(text=f"Score: {self.score} / {self.total}")
-        try:
-            master_bg = self.master.cget("bg")
-        except Exception:
-            master_bg = None
-
         if self.scoring_enabled or self.review_mode or self.test_mode:
             fg = "white"
         else:
-            fg = master_bg if master_bg is not None else "gray"
-
-        try:
-            self.status.config(fg=fg)
-        except Exception:
-            pass
+            fg = self._master_bg
+        self.status.config(fg=fg)
 
     def next_question(self):
         self.reset_btn_colors()
-        # pick a random style (keep deterministic variety in test mode as well)
-        style = random.choice([1, 2, 3, 4, 5])
-        self.current_style = style
-        if style == 1:
-            q = self.make_style1()
-        elif style == 2:
-            q = self.make_style2()
-        elif style == 3:
-            q = self.make_style3()
-        elif style == 4:
-            q = self.make_style4()
+        # take a prefetched question when one is ready, otherwise build one now
+        if self._question_queue:
+            style, q = self._question_queue.popleft()
         else:
-            q = self.make_style5()
+            style, q = self._make_random_question()
+        self.current_style = style
         # store raw dict for test recording
         self.current_question_dict = q
         self.display_question(q)
+        # refill the buffer once Tk is idle, i.e. while the user is reading the question
+        if self._prefetch_id is None:
+            self._prefetch_id = self.master.after_idle(self._prefetch_questions)
+
+    def _make_random_question(self):
+        """Build a question in a random style. Returns (style, question dict)."""
+        # pick a random style (keep deterministic variety in test mode as well)
+        idx = _RNG.randrange(len(self._style_builders))
+        return idx + 1, self._style_builders[idx]()
+
+    def _prefetch_questions(self):
+        """Top up the prefetched-question buffer (runs from the Tk idle loop)."""
+        self._prefetch_id = None
+        while len(self._question_queue) < self.PREFETCH_DEPTH:
+            self._question_queue.append(self._make_random_question())
 
     def display_question(self, q):
         # q: dict with keys: text, meta, options (list), correct (string)
@@ -519,66 +774,56 @@ class QuizApp:
         self.q_text.config(text=format_text_gui(qtext_raw))
         # prepare meta but keep it hidden until user requests hint
         self.meta_text.config(text=format_text_gui(meta_raw), pady=5)
-        try:
-            self.meta_text.pack_forget()
-        except Exception:
-            pass
-        # show the hint button in the same location
-        try:
-            self.hint_button.pack_forget()
-        except Exception:
-            pass
-        # Pack the hint button in the same location and force a redraw to avoid
-        # a race where the button doesn't become visible until another UI event.
-        self.hint_button.pack()
-        try:
-            # bring to top and force geometry update
-            self.hint_button.lift()
-            self.question_frame.update_idletasks()
-        except Exception:
-            pass
+        # Swap the hint button back into the meta's cell, but only if the last hint was
+        # revealed; otherwise the layout is already right and Tk has nothing to recompute
+        if self._hint_shown:
+            self.meta_text.grid_remove()
+            self.hint_button.grid()
+            # Guard against the hint button sometimes not reappearing until another UI event:
+            # raise it once Tk is idle (cheap, and doesn't block like update_idletasks)
+            self.master.after_idle(self.hint_button.lift)
+            self._hint_shown = False
 
         opts = q.get("options", [])
-        # Store formatted correct answer for comparison
-        self.current_answer = format_text_gui(q.get("correct"))
 
-        # shuffle options to randomize positions (format options for display)
-        combined = [format_text_gui(o) for o in opts]
-        random.shuffle(combined)
-        # find the index of the formatted correct answer
-        try:
-            self.correct_index = combined.index(self.current_answer)
-        except ValueError:
-            # fallback: if not found (shouldn't happen), set to None
-            self.correct_index = None
+        # Style builders always put the correct answer at position 0. Shuffle positions
+        # rather than strings and follow position 0 through the permutation, so options
+        # that render identically (e.g. the two "هما" duals) can't be mistaken for it.
+        order = list(range(len(opts)))
+        _RNG.shuffle(order)
+        combined = [format_text_gui(opts[p]) for p in order]
+        self.correct_index = order.index(0) if order else None
 
         for i, btn in enumerate(self.option_buttons):
             text = combined[i] if i < len(combined) else ""
-            # restore the clickable command and reset visual state (no emoji yet)
-            btn.config(text=text, state=tk.NORMAL, bg=None, command=(lambda i=i: self.check_answer(i)))
-        # store for checking
+            # reset visual state (no emoji yet); the click command is bound once in __init__
+            btn.config(text=text, state=tk.NORMAL, bg=None)
+        # store for checking (a new list per question; test records keep a reference to it)
         self.shown_options = combined
+        self._interactive = True
 
     def reset_btn_colors(self):
-        for i, btn in enumerate(self.option_buttons):
-            try:
-                btn.config(bg=self.master.cget("bg"), activebackground="#ececec")
-            except Exception:
-                pass
+        # Nothing to undo unless feedback or review coloured the buttons since the last reset
+        if not self._buttons_colored:
+            return
+        for btn in self.option_buttons:
+            btn.config(bg=self._master_bg, activebackground="#ececec")
+        self._buttons_colored = False
 
     def check_answer(self, chosen_idx):
+        # Clicks after answering, or while browsing review, are ignored
+        if not self._interactive:
+            return
         # In test mode, record answer and advance immediately without visual feedback
         if self.test_mode:
             self._record_test_answer(chosen_idx=chosen_idx, skipped=False)
             self._advance_test_or_finish()
             return
 
-        chosen_text = self.shown_options[chosen_idx]
-        correct = self.current_answer
         # Only update score/total when scoring is enabled. Always show feedback.
         if self.scoring_enabled:
             self.total += 1
-            if chosen_text == correct:
+            if chosen_idx == self.correct_index:
                 self.score += 1
 
         # apply feedback visuals
@@ -604,12 +849,15 @@ class QuizApp:
 
     def show_hint(self):
         """Reveal the meta/hint text for the current question and hide the hint button."""
+        if self._hint_shown:
+            return
+        self._hint_shown = True
         try:
-            self.hint_button.pack_forget()
+            self.hint_button.grid_remove()
         except Exception:
             pass
         try:
-            self.meta_text.pack()
+            self.meta_text.grid()
         except Exception:
             pass
 
@@ -619,304 +867,205 @@ class QuizApp:
             size = int(float(val))
         except Exception:
             return
+        # Debounce: rapid successive changes only apply the last size, 50 ms after it settles
+        if self._font_apply_id is not None:
+            self.master.after_cancel(self._font_apply_id)
+        self._font_apply_id = self.master.after(50, self._apply_pending_font_size, size)
+
+    def _apply_pending_font_size(self, size):
+        self._font_apply_id = None
         self.apply_font_size(size)
 
     def apply_font_size(self, size=None):
         """Apply the selected font size to header, question text, meta, and option buttons.
 
+        Widgets share named fonts, so this reconfigures three fonts and Tk relayouts once.
         If size is None, use the current value of self.font_size_var.
         """
         if size is None:
             size = int(self.font_size_var.get())
+        if size == self._font_size:
+            return
+        self._font_size = size
 
         # Header slightly larger
-        header_size = max(12, size + 2)
-        try:
-            self.header.config(font=(None, header_size))
-        except Exception:
-            pass
-
-        try:
-            self.q_text.config(font=(None, size))
-        except Exception:
-            pass
+        self._header_font.configure(size=max(12, size + 2))
+        # question text and option buttons
+        self._main_font.configure(size=size)
+        # meta text and status label a bit smaller, but readable
+        self._meta_font.configure(size=max(9, size - 2))
 
-        # meta text a bit smaller
-        try:
-            self.meta_text.config(font=(None, max(9, size - 2)))
-        except Exception:
-            pass
-
-        # update option button fonts
-        for btn in getattr(self, "option_buttons", []):
-            try:
-                btn.config(font=(None, size))
-            except Exception:
-                pass
+    # --- Question generation strategies ---
+    def _pick_context(self, verb_idx=None):
+        """Pick a tense (and mood, for present) for a verb and conjugate it.
 
-        # ensure status label is readable
-        try:
-            self.status.config(font=(None, max(9, size - 2)))
-        except Exception:
-            pass
+        A random sample verb is used unless verb_idx is given; present tense uses the
+        verb's own bab. Returns (verb, tense, bab_key, mood, forms).
+        """
+        if verb_idx is None:
+            verb_idx = _RNG.randrange(len(_VERB_NAMES))
+        verb = _VERB_NAMES[verb_idx]
+        tense = _TENSES[_RNG.getrandbits(1)]
+        bab_key = None
+        mood = None
+        if tense == "present":
+            bab_key = _VERB_BABS[verb_idx]
+            mood = _RNG.choice(_MOOD_NAMES)
+        _, forms = safe_conjugate(verb, tense=tense, bab_key=bab_key, mood=mood)
+        return verb, tense, bab_key, mood, forms
 
-    # --- Question generation strategies ---
     def make_style1(self):
         """Show pronoun + base verb, ask for correct conjugation for that pronoun/tense/mood."""
-        verb_entry = random.choice(SAMPLE_VERBS)
-        verb = verb_entry["verb"]
-        tenses = ["present", "present", "past"]  # 4th option is always same as correct answer tense/mood
-        moods = [m[0] for m in (ac.MOODS)]
-        random.shuffle(tenses)
-        random.shuffle(moods)
+        verb_idx = _RNG.randrange(len(_VERB_NAMES))
+        verb = _VERB_NAMES[verb_idx]
+        # 4th option is always same as correct answer tense/mood
+        tenses = _RNG.sample(_STYLE1_TENSES, 3)
+        moods = _RNG.sample(_MOOD_NAMES, 3)
         tense = tenses[0]
         bab_key = None
         mood = None
         # Use the verb's associated bab when present tense is used
         if tense == "present":
-            bab_key = verb_entry.get("bab")
+            bab_key = _VERB_BABS[verb_idx]
             mood = moods[0]
 
         _, forms = safe_conjugate(verb, tense=tense, bab_key=bab_key, mood=mood)
 
         pron_index = 0
-        if mood == "Imperative (أمر)":
+        if mood == _IMPERATIVE:
             # choose an imperative pronoun index that actually appears in UNIQUE_PRONOUNS_IDX
-            # UNIQUE_PRONOUNS_IDX excludes duplicate indices (10), so avoid picking 10 here
-            possible_prons = [i for i in range(6, 12) if i != 10]
-            pron_index = random.choice(possible_prons)
+            pron_index = _RNG.choice(_IMPERATIVE_PRONS)
         else:
             # avoid duplicate indices 4 and 10 which are not present in UNIQUE_PRONOUNS_IDX
-            possible_prons = [i for i in range(14) if i not in (4, 10)]
-            pron_index = random.choice(possible_prons)
+            pron_index = _RNG.choice(UNIQUE_PRONOUNS_IDX)
 
         correct = forms[pron_index]
 
         # All distractions are with the same verb but different mood/tense and different pronoun
         # 3 different random pronouns, which if mood is imperative, must be in imperative range!
-        pronouns = UNIQUE_PRONOUNS_IDX.copy()
-        pronouns.remove(pron_index)
-        if mood == "Imperative (أمر)":
-            pronouns = [i for i in pronouns if 6 <= i <= 11]
-        random.shuffle(pronouns)
-
-        # distractor 1: different mood/tense and different pronoun
-        ot_tense = tenses[1]
-        ot_mood = None
-        ot_pronoun = pronouns[0]
-        if ot_tense == "present":
-            ot_mood = moods[1]
-            if ot_mood == "Imperative (أمر)":
-                # ensure pronoun is in imperative range
-                imp_prons = [i for i in pronouns if 6 <= i <= 11]
-                ot_pronoun = imp_prons[0]
-        _, d1_forms = safe_conjugate(verb, tense=ot_tense, bab_key=bab_key, mood=ot_mood)
-        d1 = d1_forms[ot_pronoun]
-        pronouns.remove(ot_pronoun)
-
-        # distractor 2: different mood/tense and different pronoun
-        otot_tense = tenses[2]
-        otot_mood = None
-        otot_pronoun = pronouns[0]
-        if otot_tense == "present":
-            otot_mood = moods[2]
-            if otot_mood == "Imperative (أمر)":
-                # ensure pronoun is in imperative range
-                imp_prons = [i for i in pronouns if 6 <= i <= 11]
-                otot_pronoun = imp_prons[0]
-        _, ot_forms = safe_conjugate(verb, tense=otot_tense, bab_key=bab_key, mood=otot_mood)
-        d2 = ot_forms[otot_pronoun]
-        pronouns.remove(otot_pronoun)
-
-        # distractor 3: same tense/mood different pronoun
-        d3 = forms[pronouns[0]]
-
-        options = [correct, d1, d2, d3]
+        pool = _IMPERATIVE_PRONS if mood == _IMPERATIVE else UNIQUE_PRONOUNS_IDX
+        pronouns = [i for i in pool if i != pron_index]
+        _RNG.shuffle(pronouns)
+
+        def take_pronoun(imperative):
+            """Pop a pronoun off the end of the shuffled pool (in the imperative range if required)."""
+            if imperative and pronouns[-1] not in _IMPERATIVE_SLOTS:
+                for j in range(len(pronouns) - 2, -1, -1):
+                    if pronouns[j] in _IMPERATIVE_SLOTS:
+                        return pronouns.pop(j)
+            return pronouns.pop()
+
+        def distractors():
+            # distractor 1: different mood/tense and different pronoun
+            ot_tense = tenses[1]
+            ot_mood = None
+            if ot_tense == "present":
+                ot_mood = moods[1]
+            # ensure pronoun is in imperative range for an imperative distractor
+            ot_pronoun = take_pronoun(ot_mood == _IMPERATIVE)
+            _, d1_forms = safe_conjugate(verb, tense=ot_tense, bab_key=bab_key, mood=ot_mood)
+            yield d1_forms[ot_pronoun]
+
+            # distractor 2: different mood/tense and different pronoun
+            otot_tense = tenses[2]
+            otot_mood = None
+            if otot_tense == "present":
+                otot_mood = moods[2]
+            otot_pronoun = take_pronoun(otot_mood == _IMPERATIVE)
+            _, ot_forms = safe_conjugate(verb, tense=otot_tense, bab_key=bab_key, mood=otot_mood)
+            yield ot_forms[otot_pronoun]
+
+            # distractor 3 (and replacements if any of the above collided):
+            # same tense/mood different pronoun
+            for p in pronouns:
+                yield forms[p]
+
+        options = _unique_options(correct, distractors())
         qtext = f"Select the correct conjugation for {PRONOUNS[pron_index][0]} ({PRONOUNS[pron_index][1]})\nBase verb: {verb}\n"
-        meta = f"{tense.capitalize()}{" "+mood if mood is not None else ''}"
+        meta = _TENSE_MOOD_TITLES[(tense, mood)]
         return {"text": qtext, "meta": meta, "options": options, "correct": correct}
 
     def make_style2(self):
         """Show a conjugated form; ask which tense/mood it is (4 choices)."""
-        verb_entry = random.choice(SAMPLE_VERBS)
-        verb = verb_entry["verb"]
-        tense = random.choice(["past", "present"])
-        bab_key = None
-        mood = None
-        if tense == "present":
-            bab_key = verb_entry.get("bab")
-            mood = random.choice([m[0] for m in (ac.MOODS)])
-
-        _, forms = safe_conjugate(verb, tense=tense, bab_key=bab_key, mood=mood)
+        verb, tense, bab_key, mood, forms = self._pick_context()
         pron = 0
-        if mood == "Imperative (أمر)":
-            pron = random.randrange(6) + 6
+        if mood == _IMPERATIVE:
+            pron = _RNG.randrange(6) + 6
         else:
-            pron = random.randrange(14)
+            pron = _RNG.randrange(14)
 
         conj = forms[pron]
 
-        # options: different tense/mood combos
-        # add three distractors
-        distracts = []
-        distract_tenses = [("past", None)] + [("present", m[0]) for m in (ac.MOODS)]
-        random.shuffle(distract_tenses)
-        for t, m in distract_tenses:
-            if (t, m) != (tense, mood) and len(distracts) < 3:
-                distracts.append((t.capitalize(), m))
-
-        # Add correct answer first, then distractors
-        options = []
-        for t, m in [(tense.capitalize(), mood)] + distracts[:3]:
-            label = t if m is None else f"{t} - {m}"
-            options.append(label)
+        # options: correct tense/mood first, then three other combos
+        correct_label = _TENSE_MOOD_LABELS[(tense, mood)]
+        others = _OTHER_TENSE_MOODS[(tense, mood)]
+        options = [correct_label] + [_TENSE_MOOD_LABELS[p] for p in _RNG.sample(others, 3)]
 
         qtext = f"Which tense/mood is this conjugated form?\n{conj}\n"
         meta = f"Pronoun: {PRONOUNS[pron][0]} ({PRONOUNS[pron][1]}) Base verb: {verb}"
-        correct_label = tense.capitalize() if mood is None else f"{tense.capitalize()} - {mood}"
         return {"text": qtext, "meta": meta, "options": options, "correct": correct_label}
 
     def make_style3(self):
         """Given a verb conjugation, ask: if base verb were conjugated for new (tense/mood) but same pronoun, which would it be?"""
-        verb_entry = random.choice(SAMPLE_VERBS)
-        verb = verb_entry["verb"]
-
-        tenses = ["present", "past"]
-        moods = [m[0] for m in (ac.MOODS)]
-        random.shuffle(tenses)
-        random.shuffle(moods)
-
-        # Helper: canonicalize pron index to unique set mapping
-        def canon_pron(idx):
-            return {4: 1, 10: 7}.get(idx, idx)
-
-        # 1) Pick TARGET first (so we can include "None" when Imperative)
-        def pick_target_first():
-            tb = random.choice(["past", "present"])
-            mb = None
-            bb = None
-            if tb == "present":
-                mb = random.choice(moods)
-                bb = verb_entry.get("bab")
-            return tb, mb, bb
-
-        tense_b, mood_b, bab_b = pick_target_first()
+        verb_idx = _RNG.randrange(len(_VERB_NAMES))
+        verb = _VERB_NAMES[verb_idx]
+
+        # Tenses for the TARGET (b) and the GIVEN source (a) come from one 2-bit draw;
+        # a present tense also picks a mood and uses the verb's bab
+        bits = _RNG.getrandbits(2)
+        tense_b = _TENSES[bits & 1]
+        tense_a = _TENSES[bits >> 1]
+        bab = _VERB_BABS[verb_idx]
+
+        # 1) TARGET first (so we can include "None" when Imperative)
+        mood_b, bab_b = (_RNG.choice(_MOOD_NAMES), bab) if tense_b == "present" else (None, None)
         _, forms_b = safe_conjugate(verb, tense=tense_b, bab_key=bab_b, mood=mood_b)
 
-        # 2) Build the GIVEN conjugation (source), independent of target
-        tense_a = random.choice(["past", "present"])
-        mood_a = None
-        bab_a = None
-        if tense_a == "present":
-            bab_a = verb_entry.get("bab")
-            mood_a = random.choice(moods)
+        # 2) The GIVEN conjugation (source), independent of target
+        mood_a, bab_a = (_RNG.choice(_MOOD_NAMES), bab) if tense_a == "present" else (None, None)
         _, forms_a = safe_conjugate(verb, tense=tense_a, bab_key=bab_a, mood=mood_a)
 
-        if mood_a == "Imperative (أمر)":
-            pron_a = random.randrange(6, 12)  # 6..11 inclusive
+        if mood_a == _IMPERATIVE:
+            pron_a = _RNG.randrange(6, 12)  # 6..11 inclusive
         else:
-            pron_a = random.randrange(14)
+            pron_a = _RNG.randrange(14)
         conj_a = forms_a[pron_a]
 
         # 3) Determine correctness and generate options
-        is_imp_target = mood_b == "Imperative (أمر)"
-        valid_for_target = (not is_imp_target) or (6 <= pron_a <= 11)
+        is_imp_target = mood_b == _IMPERATIVE
+        valid_for_target = (not is_imp_target) or pron_a in _IMPERATIVE_SLOTS
 
         # Build pronoun pool based on target
-        pron_pool = UNIQUE_PRONOUNS_IDX.copy()
-        if is_imp_target:
-            pron_pool = [i for i in pron_pool if 6 <= i <= 11]
-        can = canon_pron(pron_a)
-        if can in pron_pool:
-            pron_pool.remove(can)
-        random.shuffle(pron_pool)
-
-        # Prepare alternative (tense, mood) combos distinct from target for variety
-        all_combos = [("past", None)] + [("present", m) for m in moods]
-        all_combos = [c for c in all_combos if c != (tense_b, mood_b)]
-        random.shuffle(all_combos)
-
-        def make_combo_form(tb, mb, fallback_forms_b=None, candidates=None):
-            bb = None
-            if tb == "present":
-                bb = verb_entry.get("bab")
-            _, fr = safe_conjugate(verb, tense=tb, bab_key=bb, mood=mb)
-            # choose pronoun from candidates if provided and valid for imperative
-            if candidates:
-                cands = candidates
-                if mb == "Imperative (أمر)":
-                    cands = [p for p in cands if 6 <= p <= 11]
-                if cands:
-                    return fr[cands[0]]
-            # otherwise fall back to using the same pron if valid, else 0
-            try:
-                if mb == "Imperative (أمر)" and not (6 <= pron_a <= 11):
-                    # pick a default imperative pronoun
-                    return fr[6]
-                return fr[pron_a]
-            except Exception:
-                return (fallback_forms_b or fr)[0]
-
-        options = []
-        if valid_for_target:
-            correct = forms_b[pron_a]
-            # d1: same target combo, different pronoun
+        can = _PRON_CANON.get(pron_a, pron_a)
+        base_pool = _STYLE3_PRON_POOLS[(is_imp_target, can)]
+        pron_pool = _RNG.sample(base_pool, len(base_pool))
+
+        # Alternative (tense, mood) combos distinct from target, in random order for variety
+        other_combos = _OTHER_TENSE_MOODS[(tense_b, mood_b)]
+        all_combos = _RNG.sample(other_combos, len(other_combos))
+
+        # Target has no form for the same pronoun (imperative) -> correct is "None"
+        correct = forms_b[pron_a] if valid_for_target else "None"
+
+        def distractors():
+            # An imperative target with a valid answer still offers "None" as a trap
+            if valid_for_target and is_imp_target:
+                yield "None"
+            # Same target combo, different pronoun
             if pron_pool:
-                d1 = forms_b[pron_pool.pop(0)]
-            else:
-                # fallback: another combo with pron_a
-                tb, mb = all_combos[0]
-                d1 = make_combo_form(tb, mb, fallback_forms_b=forms_b, candidates=pron_pool)
+                yield forms_b[pron_pool.pop()]
+            # Then the other combos, in shuffled order, until there are enough unique options
+            for tb, mb in all_combos:
+                yield _combo_form(verb, bab, tb, mb, pron_a, candidates=pron_pool, fallback_forms=forms_b)
 
-            # d2: different combo
-            tb2, mb2 = all_combos[0]
-            d2 = make_combo_form(tb2, mb2, fallback_forms_b=forms_b, candidates=pron_pool)
-
-            # d3: if target is imperative include "None" as distractor, else another combo
-            if is_imp_target:
-                d3 = "None"
-            else:
-                tb3, mb3 = all_combos[1] if len(all_combos) > 1 else all_combos[0]
-                d3 = make_combo_form(tb3, mb3, fallback_forms_b=forms_b, candidates=pron_pool)
-        else:
-            # Target doesn't have a valid form for the same pronoun -> correct is "None"
-            correct = "None"
-            # d1: plausible target form (different pronoun)
-            if pron_pool:
-                d1 = forms_b[pron_pool.pop(0)]
-            else:
-                # If no pronoun available (edge), synthesize from a combo
-                tb, mb = all_combos[0]
-                d1 = make_combo_form(tb, mb, fallback_forms_b=forms_b, candidates=pron_pool)
-            # d2 & d3: other combos
-            tb2, mb2 = all_combos[0]
-            d2 = make_combo_form(tb2, mb2, fallback_forms_b=forms_b, candidates=pron_pool)
-            tb3, mb3 = all_combos[1] if len(all_combos) > 1 else all_combos[0]
-            d3 = make_combo_form(tb3, mb3, fallback_forms_b=forms_b, candidates=pron_pool)
-
-        options = [correct, d1, d2, d3]
-        # Ensure uniqueness (rare case if underlying forms coincide); adjust by replacing duplicates with other combos
-        seen = set()
-        unique_opts = []
-        for opt in options:
-            if opt not in seen:
-                seen.add(opt)
-                unique_opts.append(opt)
-        while len(unique_opts) < 4:
-            # add more variety from remaining combos
-            if all_combos:
-                tb, mb = all_combos.pop()
-                unique_opts.append(make_combo_form(tb, mb, fallback_forms_b=forms_b, candidates=pron_pool))
-            else:
-                # last resort, append a fabricated distinct label
-                unique_opts.append(f"doodoo code 😭")
+        unique_opts = _unique_options(correct, distractors())
 
         qtext = (
             f"If the base verb of {conj_a} were conjugated in\n"
-            f"{tense_b.capitalize()}{' ' + mood_b if mood_b is not None else ''} (same pronoun)\n"
+            f"{_TENSE_MOOD_TITLES[(tense_b, mood_b)]} (same pronoun)\n"
             f"which one would it be?"
         )
-        meta = f"{PRONOUNS[canon_pron(pron_a)][0]} ({PRONOUNS[canon_pron(pron_a)][1]}), base verb: {verb}"
+        meta = f"{PRONOUNS[can][0]} ({PRONOUNS[can][1]}), base verb: {verb}"
 
         return {"text": qtext, "meta": meta, "options": unique_opts[:4], "correct": correct}
 
@@ -924,70 +1073,36 @@ class QuizApp:
         """Given conjugated verb, ask for pronoun (meta being the tense/mood)"""
 
         # pick random verb, tense, mood
-        verb_entry = random.choice(SAMPLE_VERBS)
-        verb = verb_entry["verb"]
-        tense = random.choice(["past", "present"])
-        bab_key = None
-        mood = None
-        if tense == "present":
-            bab_key = verb_entry.get("bab")
-            mood = random.choice([m[0] for m in (ac.MOODS)])
-        _, forms = safe_conjugate(verb, tense=tense, bab_key=bab_key, mood=mood)
+        verb, tense, bab_key, mood, forms = self._pick_context()
 
         pron = 0
-        if mood == "Imperative (أمر)":
+        if mood == _IMPERATIVE:
             # choose an imperative pronoun index that actually appears in UNIQUE_PRONOUNS_IDX
-            # UNIQUE_PRONOUNS_IDX excludes duplicate indices (10), so avoid picking 10 here
-            possible_prons = [i for i in range(6, 12) if i != 10]
-            pron = random.choice(possible_prons)
+            pron = _RNG.choice(_IMPERATIVE_PRONS)
         else:
             # avoid duplicate indices 4 and 10 which are not present in UNIQUE_PRONOUNS_IDX
-            possible_prons = [i for i in range(14) if i not in (4, 10)]
-            pron = random.choice(possible_prons)
+            pron = _RNG.choice(UNIQUE_PRONOUNS_IDX)
 
         conj = forms[pron]
 
-        pronouns_idx = UNIQUE_PRONOUNS_IDX.copy()
-        pronouns_idx.remove(pron)
-        random.shuffle(pronouns_idx)
-
         # distractor pronouns -- idx
-        d1 = pronouns_idx[0]
-        d2 = pronouns_idx[1]
-        d3 = pronouns_idx[2]
-
-        options = [
-            f"{PRONOUNS[pron][1]} - ({PRONOUNS[pron][0]})",
-            f"{PRONOUNS[d1][1]} - ({PRONOUNS[d1][0]})",
-            f"{PRONOUNS[d2][1]} - ({PRONOUNS[d2][0]})",
-            f"{PRONOUNS[d3][1]} - ({PRONOUNS[d3][0]})",
-        ]
-        correct = f"{PRONOUNS[pron][1]} - ({PRONOUNS[pron][0]})"
+        d1, d2, d3 = _RNG.sample([i for i in UNIQUE_PRONOUNS_IDX if i != pron], 3)
+
+        options = [PRONOUN_LABELS[pron], PRONOUN_LABELS[d1], PRONOUN_LABELS[d2], PRONOUN_LABELS[d3]]
+        correct = PRONOUN_LABELS[pron]
 
         qtext = f"Which pronoun corresponds to this conjugation?\n{conj}\n"
-        meta = f"Tense: {tense.capitalize()}{' ' + mood if mood is not None else ''}  Base verb: {verb}"
+        meta = f"Tense: {_TENSE_MOOD_TITLES[(tense, mood)]}  Base verb: {verb}"
         return {"text": qtext, "meta": meta, "options": options, "correct": correct}
 
     def make_style5(self):
         """Extra challenge: match base verb given conjugated form among 4 verbs."""
-        verbs = random.sample(SAMPLE_VERBS, 4)
-        verb = verbs[0]["verb"]
-        tense = random.choice(["past", "present"])
-        bab_key = None
-        mood = None
-        if tense == "present":
-            # use the chosen verb's bab for present
-            bab_key = verbs[0].get("bab")
-            mood = random.choice([m[0] for m in (ac.MOODS)])
-
-        _, forms = safe_conjugate(verb, tense=tense, bab_key=bab_key, mood=mood)
-        pron = random.randrange(14)
+        verb_idxs = _RNG.sample(range(len(_VERB_NAMES)), 4)
+        verb, tense, bab_key, mood, forms = self._pick_context(verb_idxs[0])
+        pron = _RNG.randrange(14)
         conj = forms[pron]
 
-        options = []
-        for v in verbs:
-            t, f = safe_conjugate(v["verb"], tense=tense, bab_key=v.get("bab"), mood=mood)
-            options.append(v["verb"])
+        options = [_VERB_NAMES[i] for i in verb_idxs]
 
         correct = verb
         qtext = f"Which base verb produced this conjugation?\n{conj}\n"